@@ -5,26 +5,54 @@ Main application file with PyQt5 GUI
 
 import sys
 import os
+import threading
 from PyQt5.QtWidgets import (QApplication, QMainWindow, QWidget, QVBoxLayout, 
                              QHBoxLayout, QPushButton, QLabel, QFileDialog, 
-                             QTableWidget, QTableWidgetItem, QTabWidget, 
+                             QTableWidget, QTableWidgetItem, QTableView, QTabWidget, 
                              QMessageBox, QProgressBar, QComboBox, QGroupBox,
                              QGridLayout, QHeaderView, QTextEdit, QSplitter)
-from PyQt5.QtCore import Qt, QThread, pyqtSignal
+from PyQt5.QtCore import (Qt, QThread, QThreadPool, QRunnable, QObject, QSignalMapper, QTimer, pyqtSignal,
+                          QAbstractTableModel, QModelIndex)
 from PyQt5.QtGui import QFont, QIcon
 import matplotlib
 matplotlib.use('Qt5Agg')
 from matplotlib.backends.backend_qt5agg import FigureCanvasQTAgg as FigureCanvas
 from matplotlib.figure import Figure
 import matplotlib.pyplot as plt
-import pandas as pd
+import numpy as np
 import requests
+from requests.adapters import HTTPAdapter
 import json
 from datetime import datetime
+from functools import partial
+from operator import itemgetter
 
 # API Configuration
 API_BASE_URL = 'http://localhost:8000/api'
 
+# Bytes read per chunk when streaming the PDF report to disk
+PDF_CHUNK_SIZE = 1 << 16
+
+# Equipment records fetched per page for the data table
+TABLE_PAGE_SIZE = 500
+
+# requests.Session is not guaranteed thread-safe, so each thread gets its own
+# session; they all mount this one adapter, whose urllib3 connection pools are
+# thread-safe, so keep-alive connections are still shared across threads
+api_adapter = HTTPAdapter(pool_connections=4, pool_maxsize=8)
+_thread_state = threading.local()
+
+
+def api_session():
+    """Return the calling thread's API session, creating it on first use"""
+    session = getattr(_thread_state, 'session', None)
+    if session is None:
+        session = requests.Session()
+        session.mount('http://', api_adapter)
+        session.mount('https://', api_adapter)
+        _thread_state.session = session
+    return session
+
 
 class UploadThread(QThread):
     """Background thread for file upload"""
@@ -42,8 +70,9 @@ class UploadThread(QThread):
             
             with open(self.file_path, 'rb') as f:
                 files = {'file': f}
-                response = requests.post(
+                response = api_session().post(
                     f'{API_BASE_URL}/datasets/upload/',
+                    params={'page_size': TABLE_PAGE_SIZE},
                     files=files,
                     timeout=30
                 )
@@ -64,6 +93,172 @@ class UploadThread(QThread):
             self.error.emit(f'Error: {str(e)}')
 
 
+class WorkerSignals(QObject):
+    """Signals emitted by an ApiWorker, delivered on the GUI thread"""
+    finished = pyqtSignal(object)
+    error = pyqtSignal(object)
+    done = pyqtSignal()
+
+
+class ApiWorker(QRunnable):
+    """Run a blocking API call on the thread pool"""
+    
+    def __init__(self, fn):
+        super().__init__()
+        self.fn = fn
+        self.signals = WorkerSignals()
+    
+    def run(self):
+        try:
+            result = self.fn()
+        except Exception as e:
+            self.signals.error.emit(e)
+        else:
+            self.signals.finished.emit(result)
+        finally:
+            self.signals.done.emit()
+
+
+def fetch_json(url, timeout=5):
+    """GET a JSON resource, raising on any non-success status"""
+    response = api_session().get(url, timeout=timeout)
+    response.raise_for_status()
+    return response.json()
+
+
+def fetch_if_changed(url, etag, timeout=5):
+    """
+    GET a JSON resource unless it still matches `etag`
+    Returns (etag, data), with data None when the server answers 304 Not Modified
+    """
+    headers = {'If-None-Match': etag} if etag else {}
+    response = api_session().get(url, headers=headers, timeout=timeout)
+    if response.status_code == 304:
+        return etag, None
+    response.raise_for_status()
+    return response.headers.get('ETag'), response.json()
+
+
+class EquipmentTableModel(QAbstractTableModel):
+    """Table model exposing equipment records to a QTableView"""
+    
+    COLUMNS = [
+        ('equipment_name', 'Equipment Name'),
+        ('equipment_type', 'Type'),
+        ('flowrate', 'Flowrate'),
+        ('pressure', 'Pressure'),
+        ('temperature', 'Temperature'),
+    ]
+    NUMERIC_KEYS = {'flowrate', 'pressure', 'temperature'}
+    
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self._rows = []
+        self._dataset_id = None
+        self._total = 0
+        self._fetching = False
+        # Bumped on every reset so pages requested for older records are dropped
+        self._generation = 0
+    
+    def set_records(self, records, dataset_id=None, total=None):
+        """
+        Replace the displayed records
+        When `total` exceeds len(records) the remaining rows of `dataset_id`
+        are paged in from the API as the view scrolls
+        """
+        rows = self.records_to_rows(records)
+        
+        self.beginResetModel()
+        self._rows = rows
+        self._dataset_id = dataset_id
+        self._total = len(rows) if total is None else total
+        self._fetching = False
+        self._generation += 1
+        self.endResetModel()
+    
+    def records_to_rows(self, records):
+        """Flatten API record objects to plain tuples in column order"""
+        # Positional tuples make each cell lookup an index instead of a dict .get()
+        defaults = [0 if key in self.NUMERIC_KEYS else '' for key, _ in self.COLUMNS]
+        return [
+            tuple(record.get(key, default) for (key, _), default in zip(self.COLUMNS, defaults))
+            for record in records
+        ]
+    
+    def arrays_to_rows(self, fields, arrays):
+        """Reorder value arrays sent in `fields` order into tuples in column order"""
+        pick = itemgetter(*(fields.index(key) for key, _ in self.COLUMNS))
+        return [pick(values) for values in arrays]
+    
+    def rowCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self._rows)
+    
+    def columnCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self.COLUMNS)
+    
+    def canFetchMore(self, parent=QModelIndex()):
+        if parent.isValid():
+            return False
+        return not self._fetching and len(self._rows) < self._total
+    
+    def fetchMore(self, parent=QModelIndex()):
+        """Request the next page of records on the thread pool"""
+        if not self.canFetchMore(parent):
+            return
+        
+        self._fetching = True
+        worker = ApiWorker(partial(
+            fetch_json,
+            f'{API_BASE_URL}/datasets/{self._dataset_id}/rows/'
+            f'?offset={len(self._rows)}&limit={TABLE_PAGE_SIZE}'
+        ))
+        worker.signals.finished.connect(partial(self.append_page, self._generation))
+        worker.signals.error.connect(partial(self.on_page_error, self._generation))
+        QThreadPool.globalInstance().start(worker)
+    
+    def append_page(self, generation, page):
+        """Append a page of records returned by the rows endpoint"""
+        if generation != self._generation:
+            return
+        
+        self._fetching = False
+        if not page['rows']:
+            # Fewer records than announced; stop paging
+            self._total = len(self._rows)
+            return
+        
+        rows = self.arrays_to_rows(page['fields'], page['rows'])
+        
+        start = len(self._rows)
+        self.beginInsertRows(QModelIndex(), start, start + len(rows) - 1)
+        self._rows.extend(rows)
+        self.endInsertRows()
+    
+    def on_page_error(self, generation, error):
+        """Stop paging after a failed request so the view doesn't retry on every scroll"""
+        if generation != self._generation:
+            return
+        
+        self._fetching = False
+        self._total = len(self._rows)
+        print(f'Error loading equipment records: {error}')
+    
+    def data(self, index, role=Qt.DisplayRole):
+        # Cells are only formatted when the view asks to paint them
+        if role != Qt.DisplayRole or not index.isValid():
+            return None
+        
+        value = self._rows[index.row()][index.column()]
+        if self.COLUMNS[index.column()][0] in self.NUMERIC_KEYS:
+            return f"{value:.2f}"
+        return value
+    
+    def headerData(self, section, orientation, role=Qt.DisplayRole):
+        if role == Qt.DisplayRole and orientation == Qt.Horizontal:
+            return self.COLUMNS[section][1]
+        return super().headerData(section, orientation, role)
+
+
 class MatplotlibWidget(QWidget):
     """Widget to embed matplotlib figures"""
     
@@ -72,40 +267,110 @@ class MatplotlibWidget(QWidget):
         self.figure = Figure(figsize=(8, 6), dpi=100)
         self.canvas = FigureCanvas(self.figure)
         
+        # What the figure currently shows, so unchanged charts are not rebuilt
+        self.chart_kind = None
+        self.chart_keys = None
+        self.chart_values = None
+        self.bar_containers = []
+        self.bar_labels = []
+        self.pie_artists = None
+        
+        # The canvas already resizes the figure to the widget on every resize
+        # event; recompute the layout only once the resizing has settled
+        self.relayout_timer = QTimer(self)
+        self.relayout_timer.setSingleShot(True)
+        self.relayout_timer.setInterval(50)
+        self.relayout_timer.timeout.connect(self.relayout)
+        
         layout = QVBoxLayout()
         layout.addWidget(self.canvas)
         self.setLayout(layout)
     
+    def resizeEvent(self, event):
+        super().resizeEvent(event)
+        self.relayout_timer.start()
+    
+    def relayout(self):
+        """Fit the axes to the new figure size after a resize"""
+        if self.figure.axes:
+            self.figure.tight_layout()
+            self.canvas.draw_idle()
+    
+    def is_showing(self, kind, keys, values):
+        """Return True if the figure already shows this exact chart"""
+        return (self.chart_kind, self.chart_keys, self.chart_values) == (kind, keys, values)
+    
+    def reset_figure(self, kind, keys):
+        """Start a fresh axes for a chart of a different kind or with different categories"""
+        self.figure.clear()
+        self.chart_kind = kind
+        self.chart_keys = keys
+        self.bar_containers = []
+        self.bar_labels = []
+        return self.figure.add_subplot(111)
+    
+    def clear_chart(self):
+        """Remove every plotted artist and forget what was shown"""
+        self.figure.clear()
+        self.chart_kind = None
+        self.chart_keys = None
+        self.chart_values = None
+        self.bar_containers = []
+        self.bar_labels = []
+        self.pie_artists = None
+        self.canvas.draw_idle()
+    
+    def update_bar_heights(self, series):
+        """Move the existing bars to new heights and rescale the value axis"""
+        for bars, values in zip(self.bar_containers, series):
+            for bar, height in zip(bars, values):
+                bar.set_height(height)
+        
+        for label, bar in zip(self.bar_labels, self.bar_containers[0]):
+            label.set_y(bar.get_height())
+            label.set_text(f'{int(bar.get_height())}')
+        
+        ax = self.figure.axes[0]
+        ax.relim()
+        ax.autoscale_view()
+    
     def plot_bar_chart(self, data_dict, title, xlabel, ylabel):
         """Create a bar chart"""
-        self.figure.clear()
-        ax = self.figure.add_subplot(111)
-        
         keys = list(data_dict.keys())
         values = list(data_dict.values())
         
-        bars = ax.bar(keys, values, color='#3B82F6', alpha=0.8, edgecolor='black')
-        ax.set_xlabel(xlabel, fontsize=12, fontweight='bold')
-        ax.set_ylabel(ylabel, fontsize=12, fontweight='bold')
-        ax.set_title(title, fontsize=14, fontweight='bold', pad=20)
-        ax.grid(axis='y', alpha=0.3)
+        if self.is_showing('bar', keys, values):
+            return
         
-        # Add value labels on bars
-        for bar in bars:
-            height = bar.get_height()
-            ax.text(bar.get_x() + bar.get_width()/2., height,
-                   f'{int(height)}',
-                   ha='center', va='bottom', fontsize=10)
+        if self.chart_kind == 'bar' and self.chart_keys == keys:
+            self.update_bar_heights([values])
+        else:
+            ax = self.reset_figure('bar', keys)
+            
+            bars = ax.bar(keys, values, color='#3B82F6', alpha=0.8, edgecolor='black')
+            ax.set_xlabel(xlabel, fontsize=12, fontweight='bold')
+            ax.set_ylabel(ylabel, fontsize=12, fontweight='bold')
+            ax.set_title(title, fontsize=14, fontweight='bold', pad=20)
+            ax.grid(axis='y', alpha=0.3)
+            
+            # Add value labels on bars
+            for bar in bars:
+                height = bar.get_height()
+                self.bar_labels.append(ax.text(
+                    bar.get_x() + bar.get_width()/2., height,
+                    f'{int(height)}',
+                    ha='center', va='bottom', fontsize=10
+                ))
+            self.bar_containers = [bars]
+            
+            plt.setp(ax.xaxis.get_majorticklabels(), rotation=45, ha='right')
         
-        plt.setp(ax.xaxis.get_majorticklabels(), rotation=45, ha='right')
         self.figure.tight_layout()
-        self.canvas.draw()
+        self.chart_values = values
+        self.canvas.draw_idle()
     
     def plot_multi_bar_chart(self, summary, title):
         """Create grouped bar chart for parameter comparison"""
-        self.figure.clear()
-        ax = self.figure.add_subplot(111)
-        
         parameters = ['Flowrate', 'Pressure', 'Temperature']
         min_values = [
             summary.get('min_flowrate', 0),
@@ -122,55 +387,90 @@ class MatplotlibWidget(QWidget):
             summary.get('max_pressure', 0),
             summary.get('max_temperature', 0)
         ]
+        series = [min_values, avg_values, max_values]
         
-        x = range(len(parameters))
-        width = 0.25
-        
-        ax.bar([i - width for i in x], min_values, width, label='Min', 
-               color='#EF4444', alpha=0.8)
-        ax.bar(x, avg_values, width, label='Average', 
-               color='#3B82F6', alpha=0.8)
-        ax.bar([i + width for i in x], max_values, width, label='Max', 
-               color='#10B981', alpha=0.8)
+        if self.is_showing('multi_bar', parameters, series):
+            return
         
-        ax.set_xlabel('Parameters', fontsize=12, fontweight='bold')
-        ax.set_ylabel('Values', fontsize=12, fontweight='bold')
-        ax.set_title(title, fontsize=14, fontweight='bold', pad=20)
-        ax.set_xticks(x)
-        ax.set_xticklabels(parameters)
-        ax.legend()
-        ax.grid(axis='y', alpha=0.3)
+        if self.chart_kind == 'multi_bar':
+            self.update_bar_heights(series)
+        else:
+            ax = self.reset_figure('multi_bar', parameters)
+            
+            x = range(len(parameters))
+            width = 0.25
+            
+            self.bar_containers = [
+                ax.bar([i - width for i in x], min_values, width, label='Min', 
+                       color='#EF4444', alpha=0.8),
+                ax.bar(x, avg_values, width, label='Average', 
+                       color='#3B82F6', alpha=0.8),
+                ax.bar([i + width for i in x], max_values, width, label='Max', 
+                       color='#10B981', alpha=0.8),
+            ]
+            
+            ax.set_xlabel('Parameters', fontsize=12, fontweight='bold')
+            ax.set_ylabel('Values', fontsize=12, fontweight='bold')
+            ax.set_title(title, fontsize=14, fontweight='bold', pad=20)
+            ax.set_xticks(x)
+            ax.set_xticklabels(parameters)
+            ax.legend()
+            ax.grid(axis='y', alpha=0.3)
         
         self.figure.tight_layout()
-        self.canvas.draw()
+        self.chart_values = series
+        self.canvas.draw_idle()
     
     def plot_pie_chart(self, data_dict, title):
         """Create a pie chart"""
-        self.figure.clear()
-        ax = self.figure.add_subplot(111)
-        
-        keys = list(data_dict.keys())
-        values = list(data_dict.values())
+        # Largest slices first; ties keep the API's order
+        items = sorted(data_dict.items(), key=lambda item: -item[1])
+        keys, values = tuple(zip(*items)) or ((), ())
         
-        colors = plt.cm.Set3(range(len(keys)))
-        wedges, texts, autotexts = ax.pie(
-            values, 
-            labels=keys, 
-            autopct='%1.1f%%',
-            colors=colors,
-            startangle=90,
-            textprops={'fontsize': 10}
-        )
-        
-        ax.set_title(title, fontsize=14, fontweight='bold', pad=20)
+        if self.is_showing('pie', keys, values):
+            return
         
-        # Make percentage text bold
-        for autotext in autotexts:
-            autotext.set_color('white')
-            autotext.set_fontweight('bold')
+        if self.chart_kind == 'pie' and self.chart_keys == keys:
+            self.update_pie_wedges(np.asarray(values, dtype=np.float64))
+        else:
+            ax = self.reset_figure('pie', keys)
+            
+            colors = plt.cm.Set3(range(len(keys)))
+            self.pie_artists = ax.pie(
+                np.asarray(values, dtype=np.float64), 
+                labels=keys, 
+                autopct='%1.1f%%',
+                colors=colors,
+                startangle=90,
+                textprops={'fontsize': 10}
+            )
+            
+            ax.set_title(title, fontsize=14, fontweight='bold', pad=20)
+            
+            # Make percentage text bold
+            for autotext in self.pie_artists[2]:
+                autotext.set_color('white')
+                autotext.set_fontweight('bold')
         
         self.figure.tight_layout()
-        self.canvas.draw()
+        self.chart_values = values
+        self.canvas.draw_idle()
+    
+    def update_pie_wedges(self, values):
+        """Resize the existing wedges and move their labels, mirroring the layout of Axes.pie"""
+        fractions = values / values.sum()
+        bounds = 90 + 360 * np.concatenate(([0], np.cumsum(fractions)))
+        middles = np.deg2rad((bounds[:-1] + bounds[1:]) / 2)
+        xs, ys = np.cos(middles), np.sin(middles)
+        
+        wedges, texts, autotexts = self.pie_artists
+        for i, (wedge, text, autotext) in enumerate(zip(wedges, texts, autotexts)):
+            wedge.set_theta1(bounds[i])
+            wedge.set_theta2(bounds[i + 1])
+            text.set_position((1.1 * xs[i], 1.1 * ys[i]))
+            text.set_horizontalalignment('left' if xs[i] > 0 else 'right')
+            autotext.set_position((0.6 * xs[i], 0.6 * ys[i]))
+            autotext.set_text(f'{100 * fractions[i]:.1f}%')
 
 
 class ChemicalEquipmentApp(QMainWindow):
@@ -180,11 +480,20 @@ class ChemicalEquipmentApp(QMainWindow):
         super().__init__()
         self.current_dataset = None
         self.datasets_list = []
+        self.history_etag = None
+        # Bumped whenever the shown dataset changes so stale detail responses are dropped
+        self.dataset_generation = 0
+        # Chart and table are only rebuilt when their tab is shown
+        self.chart_dirty = False
+        self.table_dirty = False
         self.init_ui()
         self.load_datasets()
     
     def init_ui(self):
         """Initialize the user interface"""
+        # Build the whole widget tree before allowing any layout or paint pass
+        self.setUpdatesEnabled(False)
+        
         self.setWindowTitle('Chemical Equipment Parameter Visualizer - Desktop')
         self.setGeometry(100, 100, 1400, 900)
         
@@ -222,9 +531,34 @@ class ChemicalEquipmentApp(QMainWindow):
         self.tabs.addTab(self.history_tab, '🕐 History')
         
         main_layout.addWidget(self.tabs)
+        self.tabs.currentChanged.connect(self.on_tab_changed)
         
         # Status bar
         self.statusBar().showMessage('Ready')
+        
+        self.setUpdatesEnabled(True)
+    
+    def on_tab_changed(self, index):
+        """Bring the chart or table up to date when its tab is opened"""
+        tab = self.tabs.widget(index)
+        
+        if tab is self.viz_tab:
+            # Build the chart canvas the first time the tab is opened
+            if self.chart_widget is None:
+                self.chart_widget = MatplotlibWidget()
+                self.viz_layout.addWidget(self.chart_widget)
+                self.chart_dirty = True
+            if self.chart_dirty:
+                self.update_chart()
+        elif tab is self.table_tab and self.table_dirty:
+            self.update_table()
+    
+    def refresh_dataset_views(self):
+        """Show the current dataset on the dashboard and mark the chart and table stale"""
+        self.update_dashboard()
+        self.chart_dirty = True
+        self.table_dirty = True
+        self.on_tab_changed(self.tabs.currentIndex())
     
     def create_header(self):
         """Create application header"""
@@ -445,9 +779,9 @@ class ChemicalEquipmentApp(QMainWindow):
         
         layout.addLayout(selector_layout)
         
-        # Matplotlib widget
-        self.chart_widget = MatplotlibWidget()
-        layout.addWidget(self.chart_widget)
+        # Matplotlib widget, created the first time this tab is shown
+        self.chart_widget = None
+        self.viz_layout = layout
         
         return tab
     
@@ -461,16 +795,14 @@ class ChemicalEquipmentApp(QMainWindow):
         self.table_info_label.setFont(QFont('Arial', 11, QFont.Bold))
         layout.addWidget(self.table_info_label)
         
-        # Table widget
-        self.data_table = QTableWidget()
-        self.data_table.setColumnCount(5)
-        self.data_table.setHorizontalHeaderLabels([
-            'Equipment Name', 'Type', 'Flowrate', 'Pressure', 'Temperature'
-        ])
+        # Table view backed by a model, so only visible cells are rendered
+        self.data_model = EquipmentTableModel(self)
+        self.data_table = QTableView()
+        self.data_table.setModel(self.data_model)
         self.data_table.horizontalHeader().setSectionResizeMode(QHeaderView.Stretch)
         self.data_table.setAlternatingRowColors(True)
         self.data_table.setStyleSheet('''
-            QTableWidget {
+            QTableView {
                 gridline-color: #D1D5DB;
                 background-color: white;
             }
@@ -492,10 +824,10 @@ class ChemicalEquipmentApp(QMainWindow):
         layout = QVBoxLayout(tab)
         
         # Refresh button
-        refresh_btn = QPushButton('🔄 Refresh History')
-        refresh_btn.setFont(QFont('Arial', 10, QFont.Bold))
-        refresh_btn.clicked.connect(self.load_datasets)
-        refresh_btn.setStyleSheet('''
+        self.refresh_btn = QPushButton('🔄 Refresh History')
+        self.refresh_btn.setFont(QFont('Arial', 10, QFont.Bold))
+        self.refresh_btn.clicked.connect(self.load_datasets)
+        self.refresh_btn.setStyleSheet('''
             QPushButton {
                 background-color: #3B82F6;
                 color: white;
@@ -506,7 +838,7 @@ class ChemicalEquipmentApp(QMainWindow):
                 background-color: #2563EB;
             }
         ''')
-        layout.addWidget(refresh_btn)
+        layout.addWidget(self.refresh_btn)
         
         # History list
         self.history_table = QTableWidget()
@@ -527,10 +859,34 @@ class ChemicalEquipmentApp(QMainWindow):
                 padding: 8px;
                 font-weight: bold;
             }
+            QPushButton#loadButton, QPushButton#deleteButton {
+                color: white;
+                padding: 5px;
+                border-radius: 3px;
+            }
+            QPushButton#loadButton {
+                background-color: #10B981;
+            }
+            QPushButton#loadButton:hover {
+                background-color: #059669;
+            }
+            QPushButton#deleteButton {
+                background-color: #EF4444;
+            }
+            QPushButton#deleteButton:hover {
+                background-color: #DC2626;
+            }
         ''')
         
         layout.addWidget(self.history_table)
         
+        # One mapper per action routes every row's button to its dataset id,
+        # instead of binding a new closure per button on each refresh
+        self.load_mapper = QSignalMapper(self)
+        self.load_mapper.mappedInt.connect(self.load_dataset_details)
+        self.delete_mapper = QSignalMapper(self)
+        self.delete_mapper.mappedInt.connect(self.delete_dataset)
+        
         return tab
     
     def create_stat_card(self, title, value, color):
@@ -611,11 +967,10 @@ class ChemicalEquipmentApp(QMainWindow):
         ''')
         self.upload_status_label.setVisible(True)
         
+        self.dataset_generation += 1
         self.current_dataset = data
         self.load_datasets()
-        self.update_dashboard()
-        self.update_table()
-        self.update_chart()
+        self.refresh_dataset_views()
         self.tabs.setCurrentIndex(1)  # Switch to dashboard
         
         self.statusBar().showMessage('Upload completed successfully')
@@ -640,32 +995,87 @@ class ChemicalEquipmentApp(QMainWindow):
         
         self.statusBar().showMessage('Upload failed')
     
+    def run_api_call(self, fn, on_finished, on_error, button=None, can_enable=None):
+        """
+        Run a blocking API call off the GUI thread, disabling `button` until it returns
+        If given, `can_enable()` decides whether the button is enabled again afterwards
+        """
+        worker = ApiWorker(fn)
+        worker.signals.finished.connect(on_finished)
+        worker.signals.error.connect(on_error)
+        if button is not None:
+            button.setEnabled(False)
+            worker.signals.done.connect(
+                lambda: button.setEnabled(can_enable is None or can_enable())
+            )
+        QThreadPool.globalInstance().start(worker)
+    
     def load_datasets(self):
         """Load list of datasets from API"""
-        try:
-            response = requests.get(f'{API_BASE_URL}/datasets/', timeout=5)
-            if response.status_code == 200:
-                self.datasets_list = response.json()
-                self.update_history_table()
-                
-                if self.datasets_list and not self.current_dataset:
-                    self.load_dataset_details(self.datasets_list[0]['id'])
-        except requests.exceptions.ConnectionError:
+        self.run_api_call(
+            partial(fetch_if_changed, f'{API_BASE_URL}/datasets/', self.history_etag),
+            self.on_datasets_loaded,
+            self.on_datasets_error,
+            self.refresh_btn
+        )
+    
+    def on_datasets_loaded(self, result):
+        """Handle the dataset list returned by the API"""
+        etag, datasets = result
+        
+        # Only rebuild the history table when the list actually changed
+        if datasets is not None:
+            self.history_etag = etag
+            self.datasets_list = datasets
+            self.update_history_table()
+        
+        if self.datasets_list and not self.current_dataset:
+            self.load_dataset_details(self.datasets_list[0]['id'])
+    
+    def on_datasets_error(self, error):
+        """Handle a failed dataset list request"""
+        if isinstance(error, requests.exceptions.ConnectionError):
             self.statusBar().showMessage('Cannot connect to server')
-        except Exception as e:
-            print(f'Error loading datasets: {e}')
+        else:
+            print(f'Error loading datasets: {error}')
     
     def load_dataset_details(self, dataset_id):
         """Load detailed dataset information"""
-        try:
-            response = requests.get(f'{API_BASE_URL}/datasets/{dataset_id}/', timeout=5)
-            if response.status_code == 200:
-                self.current_dataset = response.json()
-                self.update_dashboard()
-                self.update_table()
-                self.update_chart()
-        except Exception as e:
-            print(f'Error loading dataset details: {e}')
+        self.dataset_generation += 1
+        self.run_api_call(
+            partial(fetch_json, f'{API_BASE_URL}/datasets/{dataset_id}/?page_size={TABLE_PAGE_SIZE}'),
+            partial(self.on_dataset_details_loaded, self.dataset_generation),
+            lambda error: print(f'Error loading dataset details: {error}')
+        )
+    
+    def on_dataset_details_loaded(self, generation, dataset):
+        """Show a dataset returned by the API, unless a newer dataset was requested since"""
+        if generation != self.dataset_generation:
+            return
+        
+        self.current_dataset = dataset
+        self.refresh_dataset_views()
+    
+    def clear_dataset_views(self):
+        """Drop the current dataset and release what the dashboard, chart and table hold"""
+        self.dataset_generation += 1
+        self.current_dataset = None
+        self.chart_dirty = False
+        self.table_dirty = False
+        
+        self.data_model.set_records([])
+        self.table_info_label.setText('Equipment Records')
+        
+        if self.chart_widget is not None:
+            self.chart_widget.clear_chart()
+        
+        self.dataset_info_label.setText('No dataset loaded')
+        for card in self.stat_cards.values():
+            value_label = card.findChild(QLabel, 'value_label')
+            if value_label:
+                value_label.setText('0')
+        self.ranges_text.clear()
+        self.download_pdf_btn.setEnabled(False)
     
     def update_dashboard(self):
         """Update dashboard with current dataset"""
@@ -726,20 +1136,16 @@ class ChemicalEquipmentApp(QMainWindow):
             return
         
         equipment_records = self.current_dataset.get('equipment_records', [])
-        self.data_table.setRowCount(len(equipment_records))
-        
-        for row, equipment in enumerate(equipment_records):
-            self.data_table.setItem(row, 0, QTableWidgetItem(equipment.get('equipment_name', '')))
-            self.data_table.setItem(row, 1, QTableWidgetItem(equipment.get('equipment_type', '')))
-            self.data_table.setItem(row, 2, QTableWidgetItem(f"{equipment.get('flowrate', 0):.2f}"))
-            self.data_table.setItem(row, 3, QTableWidgetItem(f"{equipment.get('pressure', 0):.2f}"))
-            self.data_table.setItem(row, 4, QTableWidgetItem(f"{equipment.get('temperature', 0):.2f}"))
+        total_records = self.current_dataset.get('total_records', len(equipment_records))
+        self.data_model.set_records(equipment_records, self.current_dataset.get('id'), total_records)
         
-        self.table_info_label.setText(f'Equipment Records ({len(equipment_records)} total)')
+        self.table_info_label.setText(f'Equipment Records ({total_records} total)')
+        self.table_dirty = False
     
     def update_chart(self):
         """Update visualization chart"""
-        if not self.current_dataset:
+        # Nothing to draw into until the Visualizations tab has been opened
+        if not self.current_dataset or self.chart_widget is None:
             return
         
         summary = self.current_dataset.get('summary', {})
@@ -764,65 +1170,67 @@ class ChemicalEquipmentApp(QMainWindow):
                 summary,
                 'Parameter Comparison (Min, Avg, Max)'
             )
+        
+        self.chart_dirty = False
     
     def update_history_table(self):
         """Update history table with datasets"""
-        self.history_table.setRowCount(len(self.datasets_list))
-        
-        for row, dataset in enumerate(self.datasets_list):
-            filename = dataset.get('filename', 'Unknown')
-            upload_date = dataset.get('uploaded_at', '')
-            if upload_date:
-                upload_date = datetime.fromisoformat(upload_date.replace('Z', '+00:00'))
-                upload_date = upload_date.strftime('%Y-%m-%d %H:%M')
-            
-            records = str(dataset.get('total_records', 0))
+        # Prepare every cell up front so the widget loop only assigns items
+        rows = [
+            (
+                dataset.get('id'),
+                dataset.get('filename', 'Unknown'),
+                self.format_upload_date(dataset.get('uploaded_at', '')),
+                int(dataset.get('total_records', 0)),
+            )
+            for dataset in self.datasets_list
+        ]
+        
+        # Repaint once after the whole table is populated
+        self.history_table.setUpdatesEnabled(False)
+        try:
+            self.history_table.setRowCount(len(rows))
             
-            self.history_table.setItem(row, 0, QTableWidgetItem(filename))
-            self.history_table.setItem(row, 1, QTableWidgetItem(upload_date))
-            self.history_table.setItem(row, 2, QTableWidgetItem(records))
+            for row, (dataset_id, filename, upload_date, records) in enumerate(rows):
+                self.history_table.setItem(row, 0, QTableWidgetItem(filename))
+                self.history_table.setItem(row, 1, QTableWidgetItem(upload_date))
+                # Keep the count numeric so Qt compares it as a number, not text
+                records_item = QTableWidgetItem()
+                records_item.setData(Qt.DisplayRole, records)
+                self.history_table.setItem(row, 2, records_item)
             
-            # Action buttons container
-            button_layout = QHBoxLayout()
-            button_layout.setContentsMargins(5, 0, 5, 0)
+                # Action buttons container
+                button_layout = QHBoxLayout()
+                button_layout.setContentsMargins(5, 0, 5, 0)
             
-            # Load button
-            load_btn = QPushButton('Load')
-            load_btn.setStyleSheet('''
-                QPushButton {
-                    background-color: #10B981;
-                    color: white;
-                    padding: 5px;
-                    border-radius: 3px;
-                }
-                QPushButton:hover {
-                    background-color: #059669;
-                }
-            ''')
-            dataset_id = dataset.get('id')
-            load_btn.clicked.connect(lambda checked, did=dataset_id: self.load_dataset_details(did))
-            button_layout.addWidget(load_btn)
+                # Load button
+                load_btn = QPushButton('Load')
+                load_btn.setObjectName('loadButton')
+                load_btn.clicked.connect(self.load_mapper.map)
+                self.load_mapper.setMapping(load_btn, dataset_id)
+                button_layout.addWidget(load_btn)
             
-            # Delete button
-            delete_btn = QPushButton('Delete')
-            delete_btn.setStyleSheet('''
-                QPushButton {
-                    background-color: #EF4444;
-                    color: white;
-                    padding: 5px;
-                    border-radius: 3px;
-                }
-                QPushButton:hover {
-                    background-color: #DC2626;
-                }
-            ''')
-            delete_btn.clicked.connect(lambda checked, did=dataset_id: self.delete_dataset(did))
-            button_layout.addWidget(delete_btn)
+                # Delete button
+                delete_btn = QPushButton('Delete')
+                delete_btn.setObjectName('deleteButton')
+                delete_btn.clicked.connect(self.delete_mapper.map)
+                self.delete_mapper.setMapping(delete_btn, dataset_id)
+                button_layout.addWidget(delete_btn)
             
-            # Container widget for buttons
-            button_container = QWidget()
-            button_container.setLayout(button_layout)
-            self.history_table.setCellWidget(row, 3, button_container)
+                # Container widget for buttons
+                button_container = QWidget()
+                button_container.setLayout(button_layout)
+                self.history_table.setCellWidget(row, 3, button_container)
+        finally:
+            self.history_table.setUpdatesEnabled(True)
+    
+    @staticmethod
+    def format_upload_date(upload_date):
+        """Format an API timestamp for the history table"""
+        if not upload_date:
+            return upload_date
+        upload_date = datetime.fromisoformat(upload_date.replace('Z', '+00:00'))
+        return upload_date.strftime('%Y-%m-%d %H:%M')
     
     def delete_dataset(self, dataset_id):
         """Delete a dataset"""
@@ -837,24 +1245,26 @@ class ChemicalEquipmentApp(QMainWindow):
         if reply == QMessageBox.No:
             return
         
-        try:
-            response = requests.delete(f'{API_BASE_URL}/datasets/{dataset_id}/', timeout=5)
+        self.run_api_call(
+            lambda: api_session().delete(f'{API_BASE_URL}/datasets/{dataset_id}/', timeout=5),
+            partial(self.on_dataset_deleted, dataset_id),
+            lambda error: QMessageBox.critical(self, 'Error', f'Failed to delete dataset:\n{str(error)}')
+        )
+    
+    def on_dataset_deleted(self, dataset_id, response):
+        """Handle the API response to a delete request"""
+        if response.status_code == 204 or response.status_code == 200:
+            # Clear upload status message and reload
+            self.upload_status_label.setVisible(False)
             
-            if response.status_code == 204 or response.status_code == 200:
-                # Clear upload status message and reload
-                self.upload_status_label.setVisible(False)
-                
-                # If deleted dataset was current, clear current dataset
-                if self.current_dataset and self.current_dataset.get('id') == dataset_id:
-                    self.current_dataset = None
-                
-                self.load_datasets()
-                self.statusBar().showMessage('Dataset deleted successfully')
-            else:
-                QMessageBox.warning(self, 'Error', 'Failed to delete dataset')
-                
-        except Exception as e:
-            QMessageBox.critical(self, 'Error', f'Failed to delete dataset:\n{str(e)}')
+            # If deleted dataset was current, clear current dataset
+            if self.current_dataset and self.current_dataset.get('id') == dataset_id:
+                self.clear_dataset_views()
+            
+            self.load_datasets()
+            self.statusBar().showMessage('Dataset deleted successfully')
+        else:
+            QMessageBox.warning(self, 'Error', 'Failed to delete dataset')
     
     def download_pdf(self):
         """Download PDF report"""
@@ -872,31 +1282,46 @@ class ChemicalEquipmentApp(QMainWindow):
         )
         
         if filename:
-            try:
-                response = requests.get(
-                    f'{API_BASE_URL}/datasets/{dataset_id}/generate_pdf/',
-                    timeout=30
-                )
-                
-                if response.status_code == 200:
-                    with open(filename, 'wb') as f:
-                        f.write(response.content)
-                    
-                    QMessageBox.information(
-                        self,
-                        'Success',
-                        f'PDF report saved successfully!\n\n{filename}'
-                    )
-                    self.statusBar().showMessage('PDF downloaded successfully')
-                else:
-                    raise Exception('Failed to generate PDF')
-                    
-            except Exception as e:
-                QMessageBox.critical(
+            self.statusBar().showMessage('Downloading PDF report...')
+            self.run_api_call(
+                partial(self.save_pdf_report, dataset_id, filename),
+                self.on_pdf_downloaded,
+                lambda error: QMessageBox.critical(
                     self,
                     'Error',
-                    f'Failed to download PDF:\n\n{str(e)}'
-                )
+                    f'Failed to download PDF:\n\n{str(error)}'
+                ),
+                self.download_pdf_btn,
+                # The dataset may have been deleted while the report downloaded
+                can_enable=lambda: self.current_dataset is not None
+            )
+    
+    @staticmethod
+    def save_pdf_report(dataset_id, filename):
+        """Fetch the PDF report for a dataset and write it to `filename`"""
+        # Stream the body to disk so the whole report is never held in memory
+        with api_session().get(
+            f'{API_BASE_URL}/datasets/{dataset_id}/generate_pdf/',
+            timeout=30,
+            stream=True
+        ) as response:
+            if response.status_code != 200:
+                raise Exception('Failed to generate PDF')
+            
+            with open(filename, 'wb') as f:
+                for chunk in response.iter_content(chunk_size=PDF_CHUNK_SIZE):
+                    f.write(chunk)
+        
+        return filename
+    
+    def on_pdf_downloaded(self, filename):
+        """Handle a saved PDF report"""
+        QMessageBox.information(
+            self,
+            'Success',
+            f'PDF report saved successfully!\n\n{filename}'
+        )
+        self.statusBar().showMessage('PDF downloaded successfully')
 
 
 def main():
@@ -27,9 +27,11 @@ INSTALLED_APPS = [
 
 MIDDLEWARE = [
     'django.middleware.security.SecurityMiddleware',
+    'django.middleware.gzip.GZipMiddleware',
     'django.contrib.sessions.middleware.SessionMiddleware',
     'corsheaders.middleware.CorsMiddleware',
     'django.middleware.common.CommonMiddleware',
+    'django.middleware.http.ConditionalGetMiddleware',
     'django.middleware.csrf.CsrfViewMiddleware',
     'django.contrib.auth.middleware.AuthenticationMiddleware',
     'django.contrib.messages.middleware.MessageMiddleware',
@@ -106,6 +108,30 @@ REST_FRAMEWORK = {
     ],
 }
 
+# Cache Settings (rendered PDF reports); set REDIS_URL to share the cache across workers
+if os.environ.get('REDIS_URL'):
+    CACHES = {
+        'default': {
+            'BACKEND': 'django.core.cache.backends.redis.RedisCache',
+            'LOCATION': os.environ['REDIS_URL'],
+        }
+    }
+else:
+    CACHES = {
+        'default': {
+            'BACKEND': 'django.core.cache.backends.locmem.LocMemCache',
+            'LOCATION': 'chemflow',
+        }
+    }
+
+# Render PDF reports in the background right after upload. Only worthwhile with
+# a shared cache; a per-process LocMemCache would keep the PDF in the worker that
+# took the upload, so reports are rendered on demand instead
+PRERENDER_PDF_REPORTS = bool(os.environ.get('REDIS_URL'))
+
 # File Upload Settings
 FILE_UPLOAD_MAX_MEMORY_SIZE = 10485760  # 10MB
-DATA_UPLOAD_MAX_MEMORY_SIZE = 10485760
\ No newline at end of file
+DATA_UPLOAD_MAX_MEMORY_SIZE = 10485760
+
+# Load uploaded equipment rows with COPY FROM STDIN when running on PostgreSQL
+USE_PG_COPY = False
\ No newline at end of file
@@ -0,0 +1,31 @@
+# Generated by Django 5.2.8 on 2026-10-15 09:00
+
+import json
+
+from django.db import migrations, models
+
+
+def normalize_summary_data(apps, schema_editor):
+    """Replace empty or malformed summary strings with '{}' so they are valid JSON"""
+    Dataset = apps.get_model('equipment', 'Dataset')
+    for dataset in Dataset.objects.only('id', 'summary_data'):
+        try:
+            json.loads(dataset.summary_data)
+        except (TypeError, ValueError):
+            Dataset.objects.filter(pk=dataset.pk).update(summary_data='{}')
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('equipment', '0002_dataset_file'),
+    ]
+
+    operations = [
+        migrations.RunPython(normalize_summary_data, migrations.RunPython.noop),
+        migrations.AlterField(
+            model_name='dataset',
+            name='summary_data',
+            field=models.JSONField(blank=True, default=dict),
+        ),
+    ]
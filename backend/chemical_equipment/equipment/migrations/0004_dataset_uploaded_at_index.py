@@ -0,0 +1,17 @@
+# Generated by Django 5.2.8 on 2026-10-15 09:30
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('equipment', '0003_alter_dataset_summary_data'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='dataset',
+            index=models.Index(fields=['-uploaded_at'], name='equipment_d_uploade_90c946_idx'),
+        ),
+    ]
@@ -1,6 +1,5 @@
 from django.db import models
 from django.contrib.auth.models import User
-import json
 
 
 class Dataset(models.Model):
@@ -10,26 +9,14 @@ class Dataset(models.Model):
     filename = models.CharField(max_length=255)
     uploaded_at = models.DateTimeField(auto_now_add=True)
     total_records = models.IntegerField(default=0)
-    summary_data = models.TextField(blank=True)  # JSON string
+    summary_data = models.JSONField(default=dict, blank=True)
     
     class Meta:
         ordering = ['-uploaded_at']
+        indexes = [models.Index(fields=['-uploaded_at'])]
         
     def __str__(self):
         return f"{self.filename} - {self.uploaded_at.strftime('%Y-%m-%d %H:%M')}"
-    
-    def get_summary_data(self):
-        """Return summary data as dictionary"""
-        try:
-            if self.summary_data and self.summary_data.strip():
-                return json.loads(self.summary_data)
-        except (json.JSONDecodeError, ValueError):
-            pass
-        return {}
-    
-    def set_summary_data(self, data):
-        """Store summary data as JSON string"""
-        self.summary_data = json.dumps(data)
         
 
 class Equipment(models.Model):
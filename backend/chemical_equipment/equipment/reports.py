@@ -0,0 +1,347 @@
+"""
+PDF report rendering for uploaded datasets
+"""
+import hashlib
+import io
+import json
+import logging
+from concurrent.futures import ThreadPoolExecutor
+
+from django.core.cache import cache
+from django.db import connection
+import matplotlib
+from matplotlib.figure import Figure
+from reportlab.lib import colors
+from reportlab.lib.pagesizes import letter
+from reportlab.lib.styles import getSampleStyleSheet, ParagraphStyle
+from reportlab.lib.units import inch
+from reportlab.platypus import SimpleDocTemplate, Table, TableStyle, Paragraph, Spacer, PageBreak, Image
+
+from .models import Dataset
+
+logger = logging.getLogger(__name__)
+
+# Charts are shown at most 6in wide in the PDF, so screen resolution is enough
+CHART_DPI = 96
+
+matplotlib.rcParams.update({
+    'path.simplify': True,
+    'path.simplify_threshold': 1.0,
+    'agg.path.chunksize': 10000,
+})
+
+# Seconds a rendered PDF report stays in the cache
+PDF_CACHE_TIMEOUT = 60 * 60 * 24
+
+# Report styles never change, so they are built once and shared by every render
+STYLES = getSampleStyleSheet()
+
+HEADING_STYLE = ParagraphStyle(
+    'CustomHeading',
+    parent=STYLES['Heading2'],
+    fontSize=16,
+    textColor=colors.HexColor('#334155'),
+    spaceAfter=12,
+    spaceBefore=20,
+    fontName='Helvetica-Bold'
+)
+
+HEADER_TABLE_STYLE = TableStyle([
+    ('BACKGROUND', (0, 0), (-1, -1), colors.HexColor('#10b981')),
+    ('ALIGN', (0, 0), (-1, -1), 'CENTER'),
+    ('VALIGN', (0, 0), (-1, -1), 'MIDDLE'),
+    ('TOPPADDING', (0, 0), (-1, -1), 20),
+    ('BOTTOMPADDING', (0, 0), (-1, -1), 20),
+])
+
+INFO_TABLE_STYLE = TableStyle([
+    ('BACKGROUND', (0, 0), (-1, 0), colors.HexColor('#334155')),
+    ('TEXTCOLOR', (0, 0), (-1, 0), colors.whitesmoke),
+    ('ALIGN', (0, 0), (-1, 0), 'CENTER'),
+    ('FONTNAME', (0, 0), (-1, 0), 'Helvetica-Bold'),
+    ('FONTSIZE', (0, 0), (-1, 0), 14),
+    ('BACKGROUND', (0, 1), (0, -1), colors.HexColor('#f1f5f9')),
+    ('FONTNAME', (0, 1), (0, -1), 'Helvetica-Bold'),
+    ('TEXTCOLOR', (0, 1), (0, -1), colors.HexColor('#475569')),
+    ('BACKGROUND', (1, 1), (1, -1), colors.white),
+    ('GRID', (0, 0), (-1, -1), 1, colors.HexColor('#e2e8f0')),
+    ('VALIGN', (0, 0), (-1, -1), 'MIDDLE'),
+    ('TOPPADDING', (0, 0), (-1, -1), 10),
+    ('BOTTOMPADDING', (0, 0), (-1, -1), 10),
+    ('LEFTPADDING', (0, 0), (-1, -1), 15),
+])
+
+STATS_TABLE_STYLE = TableStyle([
+    ('BACKGROUND', (0, 0), (-1, 0), colors.HexColor('#10b981')),
+    ('TEXTCOLOR', (0, 0), (-1, 0), colors.whitesmoke),
+    ('ALIGN', (0, 0), (-1, -1), 'CENTER'),
+    ('FONTNAME', (0, 0), (-1, 0), 'Helvetica-Bold'),
+    ('FONTSIZE', (0, 0), (-1, 0), 11),
+    ('FONTNAME', (0, 1), (0, -1), 'Helvetica-Bold'),
+    ('BACKGROUND', (0, 1), (-1, -1), colors.white),
+    ('ROWBACKGROUNDS', (0, 1), (-1, -1), [colors.white, colors.HexColor('#f8fafc')]),
+    ('GRID', (0, 0), (-1, -1), 1, colors.HexColor('#e2e8f0')),
+    ('VALIGN', (0, 0), (-1, -1), 'MIDDLE'),
+    ('TOPPADDING', (0, 0), (-1, -1), 10),
+    ('BOTTOMPADDING', (0, 0), (-1, -1), 10),
+])
+
+RECORDS_TABLE_STYLE = TableStyle([
+    ('BACKGROUND', (0, 0), (-1, 0), colors.HexColor('#334155')),
+    ('TEXTCOLOR', (0, 0), (-1, 0), colors.whitesmoke),
+    ('ALIGN', (0, 0), (-1, -1), 'CENTER'),
+    ('FONTNAME', (0, 0), (-1, 0), 'Helvetica-Bold'),
+    ('FONTSIZE', (0, 0), (-1, 0), 10),
+    ('FONTSIZE', (0, 1), (-1, -1), 9),
+    ('ROWBACKGROUNDS', (0, 1), (-1, -1), [colors.white, colors.HexColor('#f8fafc')]),
+    ('GRID', (0, 0), (-1, -1), 1, colors.HexColor('#e2e8f0')),
+    ('VALIGN', (0, 0), (-1, -1), 'MIDDLE'),
+    ('TOPPADDING', (0, 0), (-1, -1), 8),
+    ('BOTTOMPADDING', (0, 0), (-1, -1), 8),
+])
+
+# Renders reports after upload so downloads don't pay for matplotlib + reportlab;
+# used only when settings.PRERENDER_PDF_REPORTS is enabled
+_report_executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix='pdf-report')
+
+
+def report_cache_key(dataset):
+    """Cache key for a dataset's report; datasets are immutable once uploaded"""
+    summary_json = json.dumps(dataset.summary_data, sort_keys=True)
+    summary_hash = hashlib.md5(summary_json.encode()).hexdigest()
+    return f'pdf:{dataset.id}:{summary_hash}'
+
+
+def get_pdf_report(dataset):
+    """Return the cached PDF report for a dataset, rendering it on a miss"""
+    cache_key = report_cache_key(dataset)
+    pdf_bytes = cache.get(cache_key)
+    if pdf_bytes is None:
+        pdf_bytes = build_pdf_report(dataset)
+        cache.set(cache_key, pdf_bytes, timeout=PDF_CACHE_TIMEOUT)
+    return pdf_bytes
+
+
+def schedule_pdf_report(dataset_id):
+    """Render and cache a dataset's report on the background worker"""
+    _report_executor.submit(_prerender_pdf_report, dataset_id)
+
+
+def _prerender_pdf_report(dataset_id):
+    try:
+        get_pdf_report(Dataset.objects.get(pk=dataset_id))
+    except Dataset.DoesNotExist:
+        pass
+    except Exception:
+        logger.exception('Failed to pre-render PDF report for dataset %s', dataset_id)
+    finally:
+        connection.close()
+
+
+def _figure_image(fig, width, height):
+    """Render a matplotlib figure to an in-memory PNG flowable"""
+    image_buffer = io.BytesIO()
+    fig.savefig(image_buffer, format='png', dpi=CHART_DPI, bbox_inches='tight', facecolor='white')
+    image_buffer.seek(0)
+    return Image(image_buffer, width=width, height=height)
+
+
+def build_pdf_report(dataset):
+    """
+    Render the PDF report for a dataset and return its bytes
+    """
+    summary = dataset.summary_data
+    
+    # Create PDF buffer
+    buffer = io.BytesIO()
+    doc = SimpleDocTemplate(
+        buffer, 
+        pagesize=letter,
+        rightMargin=0.75*inch,
+        leftMargin=0.75*inch,
+        topMargin=1*inch,
+        bottomMargin=0.75*inch,
+        title=f'ChemFlow Report - {dataset.filename}',
+        author='ChemFlow Analytics Platform',
+        subject='Chemical Equipment Analysis Report'
+        )
+    elements = []
+    
+    # Header with colored background
+    header_data = [[Paragraph('<font size=24 color="#ffffff"><b>ChemFlow Analytics Report</b></font>', STYLES['Normal'])]]
+    header_table = Table(header_data, colWidths=[6.5*inch])
+    header_table.setStyle(HEADER_TABLE_STYLE)
+    elements.append(header_table)
+    elements.append(Spacer(1, 0.4*inch))
+    
+    # Dataset Information Card
+    info_data = [
+        ['Dataset Information', ''],
+        ['Filename:', dataset.filename],
+        ['Upload Date:', dataset.uploaded_at.strftime('%B %d, %Y at %H:%M:%S')],
+        ['Total Records:', str(dataset.total_records)],
+    ]
+    info_table = Table(info_data, colWidths=[2*inch, 4.5*inch])
+    info_table.setStyle(INFO_TABLE_STYLE)
+    elements.append(info_table)
+    elements.append(Spacer(1, 0.3*inch))
+    
+    # Summary Statistics Cards
+    elements.append(Paragraph('Summary Statistics', HEADING_STYLE))
+    
+    stats_data = [
+        ['Parameter', 'Minimum', 'Average', 'Maximum'],
+        [
+            'Flowrate',
+            f"{summary.get('min_flowrate', 0):.2f}",
+            f"{summary.get('avg_flowrate', 0):.2f}",
+            f"{summary.get('max_flowrate', 0):.2f}"
+        ],
+        [
+            'Pressure',
+            f"{summary.get('min_pressure', 0):.2f}",
+            f"{summary.get('avg_pressure', 0):.2f}",
+            f"{summary.get('max_pressure', 0):.2f}"
+        ],
+        [
+            'Temperature',
+            f"{summary.get('min_temperature', 0):.2f}",
+            f"{summary.get('avg_temperature', 0):.2f}",
+            f"{summary.get('max_temperature', 0):.2f}"
+        ],
+    ]
+    
+    stats_table = Table(stats_data, colWidths=[2*inch, 1.5*inch, 1.5*inch, 1.5*inch])
+    stats_table.setStyle(STATS_TABLE_STYLE)
+    elements.append(stats_table)
+    elements.append(Spacer(1, 0.4*inch))
+    
+    # Generate Charts
+    type_dist = summary.get('type_distribution', {})
+    
+    if type_dist:
+        # 1. Bar Chart for Type Distribution
+        fig = Figure(figsize=(8, 4))
+        ax = fig.subplots()
+        types = list(type_dist.keys())
+        counts = list(type_dist.values())
+        colors_list = ['#818cf8', '#34d399', '#a78bfa', '#fb923c', '#fbbf24', '#38bdf8']
+        
+        bars = ax.bar(types, counts, color=colors_list[:len(types)], edgecolor='white', linewidth=2)
+        ax.set_xlabel('Equipment Type', fontsize=12, fontweight='bold')
+        ax.set_ylabel('Count', fontsize=12, fontweight='bold')
+        ax.set_title('Equipment Type Distribution', fontsize=14, fontweight='bold', pad=20)
+        ax.spines['top'].set_visible(False)
+        ax.spines['right'].set_visible(False)
+        ax.grid(axis='y', alpha=0.3, linestyle='--')
+        
+        # Add value labels on bars
+        for bar in bars:
+            height = bar.get_height()
+            ax.text(bar.get_x() + bar.get_width()/2., height,
+                   f'{int(height)}',
+                   ha='center', va='bottom', fontweight='bold')
+        
+        fig.tight_layout()
+        
+        elements.append(Paragraph('Equipment Type Distribution', HEADING_STYLE))
+        elements.append(Spacer(1, 0.1*inch))
+        elements.append(_figure_image(fig, width=6*inch, height=3*inch))
+        elements.append(Spacer(1, 0.3*inch))
+        
+        # 2. Pie Chart
+        fig = Figure(figsize=(7, 5))
+        ax = fig.subplots()
+        pie_result = ax.pie(
+            counts, 
+            labels=types, 
+            autopct='%1.1f%%',
+            colors=colors_list[:len(types)],
+            startangle=90,
+            explode=[0.05] * len(types),
+            shadow=True
+        )
+        wedges, texts, autotexts = pie_result if len(pie_result) == 3 else (pie_result[0], pie_result[1], [])
+        
+        for text in texts:
+            text.set_fontsize(11)
+            text.set_fontweight('bold')
+        for autotext in autotexts:
+            autotext.set_color('white')
+            autotext.set_fontsize(10)
+            autotext.set_fontweight('bold')
+            
+        ax.set_title('Type Distribution Breakdown', fontsize=14, fontweight='bold', pad=20)
+        fig.tight_layout()
+        
+        elements.append(PageBreak())
+        elements.append(Paragraph('Type Distribution Breakdown', HEADING_STYLE))
+        elements.append(Spacer(1, 0.1*inch))
+        elements.append(_figure_image(fig, width=5*inch, height=3.5*inch))
+        elements.append(Spacer(1, 0.3*inch))
+        
+        # 3. Parameter Comparison Chart
+        fig = Figure(figsize=(8, 4))
+        ax = fig.subplots()
+        parameters = ['Flowrate', 'Pressure', 'Temperature']
+        min_vals = [summary.get('min_flowrate', 0), summary.get('min_pressure', 0), summary.get('min_temperature', 0)]
+        avg_vals = [summary.get('avg_flowrate', 0), summary.get('avg_pressure', 0), summary.get('avg_temperature', 0)]
+        max_vals = [summary.get('max_flowrate', 0), summary.get('max_pressure', 0), summary.get('max_temperature', 0)]
+        
+        x = range(len(parameters))
+        width = 0.25
+        
+        ax.bar([i - width for i in x], min_vals, width, label='Minimum', color='#ef4444')
+        ax.bar(x, avg_vals, width, label='Average', color='#10b981')
+        ax.bar([i + width for i in x], max_vals, width, label='Maximum', color='#3b82f6')
+        
+        ax.set_xlabel('Parameters', fontsize=12, fontweight='bold')
+        ax.set_ylabel('Values', fontsize=12, fontweight='bold')
+        ax.set_title('Parameter Comparison (Min/Avg/Max)', fontsize=14, fontweight='bold', pad=20)
+        ax.set_xticks(x)
+        ax.set_xticklabels(parameters)
+        ax.legend(loc='upper left', framealpha=0.9)
+        ax.spines['top'].set_visible(False)
+        ax.spines['right'].set_visible(False)
+        ax.grid(axis='y', alpha=0.3, linestyle='--')
+        
+        fig.tight_layout()
+        
+        elements.append(Paragraph('Parameter Comparison Analysis', HEADING_STYLE))
+        elements.append(Spacer(1, 0.1*inch))
+        elements.append(_figure_image(fig, width=6*inch, height=3*inch))
+        elements.append(Spacer(1, 0.3*inch))
+    
+    # Equipment Records Table
+    elements.append(PageBreak())
+    elements.append(Paragraph('Equipment Records Details', HEADING_STYLE))
+    elements.append(Spacer(1, 0.2*inch))
+    
+    equipment = dataset.equipment_records.only(
+        'equipment_name', 'equipment_type', 'flowrate', 'pressure', 'temperature'
+    )[:20]
+    
+    eq_data = [['Name', 'Type', 'Flowrate', 'Pressure', 'Temperature']] + [
+        [
+            eq.equipment_name[:25],
+            eq.equipment_type,
+            f"{eq.flowrate:.2f}",
+            f"{eq.pressure:.2f}",
+            f"{eq.temperature:.2f}"
+        ]
+        for eq in equipment
+    ]
+    
+    eq_table = Table(eq_data, colWidths=[2*inch, 1.3*inch, 1.1*inch, 1.1*inch, 1*inch])
+    eq_table.setStyle(RECORDS_TABLE_STYLE)
+    elements.append(eq_table)
+    
+    # Footer
+    elements.append(Spacer(1, 0.5*inch))
+    footer_text = f'<para align=center><font size=8 color="#64748b">Generated by ChemFlow Analytics Platform | {dataset.uploaded_at.strftime("%B %d, %Y")}</font></para>'
+    elements.append(Paragraph(footer_text, STYLES['Normal']))
+    
+    # Build PDF
+    doc.build(elements)
+    
+    return buffer.getvalue()
@@ -14,26 +14,18 @@ class DatasetSerializer(serializers.ModelSerializer):
     """Serializer for Dataset model with equipment records"""
     
     equipment_records = EquipmentSerializer(many=True, read_only=True)
-    summary = serializers.SerializerMethodField()
+    summary = serializers.JSONField(source='summary_data', read_only=True)
     
     class Meta:
         model = Dataset
         fields = ['id', 'filename', 'uploaded_at', 'total_records', 'summary', 'equipment_records']
-        
-    def get_summary(self, obj):
-        """Get summary data as dictionary"""
-        return obj.get_summary_data()
 
 
 class DatasetListSerializer(serializers.ModelSerializer):
     """Lightweight serializer for dataset list"""
     
-    summary = serializers.SerializerMethodField()
+    summary = serializers.JSONField(source='summary_data', read_only=True)
     
     class Meta:
         model = Dataset
-        fields = ['id', 'filename', 'uploaded_at', 'total_records', 'summary']
-        
-    def get_summary(self, obj):
-        """Get summary data as dictionary"""
-        return obj.get_summary_data()
\ No newline at end of file
+        fields = ['id', 'filename', 'uploaded_at', 'total_records', 'summary']
\ No newline at end of file
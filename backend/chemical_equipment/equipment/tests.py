@@ -1,3 +1,231 @@
-from django.test import TestCase
+import io
+import json
+from unittest import mock
 
-# Create your tests here.
+from django.core.files.uploadedfile import SimpleUploadedFile
+from django.test import TestCase, override_settings
+import pandas as pd
+from rest_framework.test import APIClient
+
+from .models import Dataset, Equipment
+from .views import ROWS_MAX_PAGE_SIZE, ROWS_PAGE_SIZE
+
+
+def make_csv(count):
+    """Build a CSV upload with `count` valid equipment rows"""
+    lines = ['Equipment Name,Type,Flowrate,Pressure,Temperature']
+    lines += [f'Unit-{i % 7},Type-{i % 3},{i},{i / 2},{i * 2}' for i in range(count)]
+    return ('\n'.join(lines) + '\n').encode()
+
+
+class DatasetAPITestCase(TestCase):
+    """Shared helpers for exercising the dataset API"""
+
+    def setUp(self):
+        self.client = APIClient()
+
+    def upload(self, count, filename='data.csv', query=''):
+        """Upload a generated CSV and return the decoded streaming response body"""
+        response = self.client.post(
+            f'/api/datasets/upload/{query}',
+            {'file': SimpleUploadedFile(filename, make_csv(count))},
+            format='multipart'
+        )
+        self.assertEqual(response.status_code, 201)
+        return json.loads(b''.join(response.streaming_content))
+
+
+class CsvIngestTests(DatasetAPITestCase):
+    """Tests for CSV parsing and the summary merged across chunks"""
+
+    CSV = (
+        'Equipment Name,Type,Flowrate,Pressure,Temperature,Notes\n'
+        'Pump-1,Pump,120.5,5.2,110,a\n'
+        'Valve-1,Valve,,4.1,105,b\n'
+        'HX-1,HeatExchanger,150,6.2,130,c\n'
+        'Pump-2,Pump,130,5.6,-15.5,d\n'
+        'Valve-2,Valve,60,,100,e\n'
+        ',Pump,10,1,1,f\n'
+        'Reactor-1,,200,9.9,250,g\n'
+        'Reactor-2,Reactor,210.25,10.1,260,h\n'
+        'Valve-3,Valve,55,3.9,95,i\n'
+        'Pump-3,Pump,0.5,0.2,20,j\n'
+        'HX-2,HeatExchanger,145,6,125,k\n'
+        'Compressor-1,Compressor,300,12.5,320.75,l\n'
+    ).encode()
+
+    def upload_csv(self, content, filename='data.csv'):
+        return self.client.post(
+            '/api/datasets/upload/',
+            {'file': SimpleUploadedFile(filename, content)},
+            format='multipart'
+        )
+
+    def test_chunked_summary_matches_pandas(self):
+        # Chunks of three rows: NaN rows and every type span several chunks,
+        # and the second chunk loses all but one row to dropna
+        with mock.patch('equipment.views.CSV_CHUNK_SIZE', 3):
+            response = self.upload_csv(self.CSV)
+        self.assertEqual(response.status_code, 201)
+        summary = json.loads(b''.join(response.streaming_content))['summary']
+
+        frame = pd.read_csv(io.BytesIO(self.CSV)).drop(columns='Notes').dropna()
+        self.assertEqual(summary['total_count'], len(frame))
+        self.assertEqual(summary['type_distribution'], frame['Type'].value_counts().to_dict())
+        for column in ('Flowrate', 'Pressure', 'Temperature'):
+            name = column.lower()
+            self.assertAlmostEqual(summary[f'avg_{name}'], frame[column].mean())
+            self.assertEqual(summary[f'min_{name}'], frame[column].min())
+            self.assertEqual(summary[f'max_{name}'], frame[column].max())
+
+        dataset = Dataset.objects.get()
+        self.assertEqual(dataset.total_records, len(frame))
+        self.assertEqual(dataset.equipment_records.count(), len(frame))
+
+    def test_summary_does_not_depend_on_chunk_size(self):
+        summaries = []
+        for chunk_size in (1, 4, 1000):
+            with mock.patch('equipment.views.CSV_CHUNK_SIZE', chunk_size):
+                response = self.upload_csv(self.CSV)
+            summaries.append(json.loads(b''.join(response.streaming_content))['summary'])
+
+        for summary in summaries[1:]:
+            self.assertEqual(summary.keys(), summaries[0].keys())
+            for key, value in summary.items():
+                if isinstance(value, float):
+                    self.assertAlmostEqual(value, summaries[0][key])
+                else:
+                    self.assertEqual(value, summaries[0][key])
+
+    def test_missing_header_column_is_rejected(self):
+        response = self.upload_csv(b'Equipment Name,Type,Flowrate,Pressure\nPump-1,Pump,1,2\n')
+        self.assertEqual(response.status_code, 400)
+        self.assertEqual(response.data['error'], 'Missing required columns: Temperature')
+        self.assertFalse(Dataset.objects.exists())
+
+    def test_header_with_bom_is_accepted(self):
+        response = self.upload_csv(b'\xef\xbb\xbf' + self.CSV)
+        self.assertEqual(response.status_code, 201)
+
+    def test_csv_without_valid_rows_is_rejected(self):
+        response = self.upload_csv(b'Equipment Name,Type,Flowrate,Pressure,Temperature\nPump-1,Pump,,2,3\n')
+        self.assertEqual(response.status_code, 400)
+        self.assertFalse(Dataset.objects.exists())
+
+
+class DatasetPagingTests(DatasetAPITestCase):
+    """Tests for the page_size parameter and the rows endpoint"""
+
+    def test_upload_page_size_truncates_records(self):
+        data = self.upload(30, query='?page_size=10')
+        self.assertEqual(data['total_records'], 30)
+        self.assertEqual(len(data['equipment_records']), 10)
+
+    def test_upload_page_size_zero_returns_no_records(self):
+        data = self.upload(30, query='?page_size=0')
+        self.assertEqual(data['equipment_records'], [])
+
+    def test_upload_without_page_size_returns_all_records(self):
+        data = self.upload(30)
+        self.assertEqual(len(data['equipment_records']), 30)
+
+    def test_upload_rejects_invalid_page_size(self):
+        response = self.client.post(
+            '/api/datasets/upload/?page_size=-1',
+            {'file': SimpleUploadedFile('data.csv', make_csv(3))},
+            format='multipart'
+        )
+        self.assertEqual(response.status_code, 400)
+        self.assertFalse(Dataset.objects.exists())
+
+    def test_retrieve_page_size_truncates_records(self):
+        dataset_id = self.upload(30)['id']
+
+        response = self.client.get(f'/api/datasets/{dataset_id}/?page_size=10')
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.data['total_records'], 30)
+        self.assertEqual(len(response.data['equipment_records']), 10)
+
+        response = self.client.get(f'/api/datasets/{dataset_id}/')
+        self.assertEqual(len(response.data['equipment_records']), 30)
+
+    def test_retrieve_rejects_invalid_page_size(self):
+        dataset_id = self.upload(3)['id']
+        for value in ('-1', 'abc'):
+            response = self.client.get(f'/api/datasets/{dataset_id}/?page_size={value}')
+            self.assertEqual(response.status_code, 400)
+
+    def test_rows_offset_and_limit(self):
+        dataset_id = self.upload(30)['id']
+
+        response = self.client.get(f'/api/datasets/{dataset_id}/rows/?offset=5&limit=10')
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.data['count'], 30)
+        self.assertEqual(response.data['offset'], 5)
+        self.assertEqual(len(response.data['rows']), 10)
+        self.assertEqual(
+            list(response.data['fields']),
+            ['id', 'equipment_name', 'equipment_type', 'flowrate', 'pressure', 'temperature']
+        )
+
+    def test_rows_default_limit(self):
+        dataset_id = self.upload(ROWS_PAGE_SIZE + 20)['id']
+        response = self.client.get(f'/api/datasets/{dataset_id}/rows/')
+        self.assertEqual(len(response.data['rows']), ROWS_PAGE_SIZE)
+
+    def test_rows_limit_is_capped(self):
+        dataset_id = self.upload(ROWS_MAX_PAGE_SIZE + 20)['id']
+        response = self.client.get(f'/api/datasets/{dataset_id}/rows/?limit={ROWS_MAX_PAGE_SIZE * 2}')
+        self.assertEqual(len(response.data['rows']), ROWS_MAX_PAGE_SIZE)
+
+    def test_rows_rejects_invalid_parameters(self):
+        dataset_id = self.upload(3)['id']
+        for query in ('offset=-1', 'limit=-1', 'offset=abc', 'limit=1.5'):
+            response = self.client.get(f'/api/datasets/{dataset_id}/rows/?{query}')
+            self.assertEqual(response.status_code, 400, query)
+
+    def test_rows_pages_cover_records_without_overlap(self):
+        data = self.upload(53, query='?page_size=10')
+        dataset_id = data['id']
+
+        ids = [record['id'] for record in data['equipment_records']]
+        while True:
+            response = self.client.get(f'/api/datasets/{dataset_id}/rows/?offset={len(ids)}&limit=7')
+            if not response.data['rows']:
+                break
+            ids += [row[0] for row in response.data['rows']]
+
+        self.assertEqual(len(ids), 53)
+        self.assertEqual(set(ids), set(Equipment.objects.filter(dataset_id=dataset_id).values_list('id', flat=True)))
+
+
+class DatasetHistoryTests(DatasetAPITestCase):
+    """Tests for trimming the upload history to the newest datasets"""
+
+    def test_upload_keeps_five_newest_datasets(self):
+        uploaded = [self.upload(4, filename=f'data{i}.csv')['id'] for i in range(7)]
+
+        self.assertEqual(
+            sorted(Dataset.objects.values_list('id', flat=True)),
+            sorted(uploaded[-5:])
+        )
+        self.assertEqual(Equipment.objects.count(), 5 * 4)
+        self.assertFalse(Equipment.objects.exclude(dataset_id__in=uploaded[-5:]).exists())
+
+
+class PdfPrerenderTests(DatasetAPITestCase):
+    """Tests for background PDF rendering after upload"""
+
+    @override_settings(PRERENDER_PDF_REPORTS=False)
+    def test_upload_does_not_prerender_without_shared_cache(self):
+        with mock.patch('equipment.views.schedule_pdf_report') as schedule:
+            with self.captureOnCommitCallbacks(execute=True):
+                self.upload(3)
+        schedule.assert_not_called()
+
+    @override_settings(PRERENDER_PDF_REPORTS=True)
+    def test_upload_prerenders_with_shared_cache(self):
+        with mock.patch('equipment.views.schedule_pdf_report') as schedule:
+            with self.captureOnCommitCallbacks(execute=True):
+                dataset_id = self.upload(3)['id']
+        schedule.assert_called_once_with(dataset_id)
@@ -2,13 +2,162 @@ from rest_framework import viewsets, status
 from rest_framework.decorators import action
 from rest_framework.response import Response
 from rest_framework.permissions import AllowAny
-from django.http import HttpResponse
+from django.http import HttpResponse, StreamingHttpResponse
+from django.conf import settings
+from django.db import connection, transaction
 from django.db.models import Avg, Count
+import numpy as np
 import pandas as pd
+import csv
 import io
+import json
+from collections import Counter
+from itertools import islice
 
 from .models import Dataset, Equipment
-from .serializers import DatasetSerializer, DatasetListSerializer
+from .reports import get_pdf_report, schedule_pdf_report
+from .serializers import DatasetSerializer, DatasetListSerializer, EquipmentSerializer
+
+# Maximum number of Equipment rows sent in a single INSERT
+BULK_CREATE_BATCH_SIZE = 1000
+
+# Number of CSV rows parsed per chunk during upload
+CSV_CHUNK_SIZE = 50_000
+
+REQUIRED_COLUMNS = ['Equipment Name', 'Type', 'Flowrate', 'Pressure', 'Temperature']
+
+NUMERIC_COLUMNS = ['Flowrate', 'Pressure', 'Temperature']
+
+# Fields of each record in the equipment_records payload, as in EquipmentSerializer
+EQUIPMENT_FIELDS = ('id', 'equipment_name', 'equipment_type', 'flowrate', 'pressure', 'temperature')
+
+# Deterministic record order so offset pages never overlap or skip rows
+EQUIPMENT_ORDERING = ('equipment_name', 'id')
+
+# Default and maximum number of records returned by the rows endpoint
+ROWS_PAGE_SIZE = 500
+ROWS_MAX_PAGE_SIZE = 5000
+
+# Explicit parser dtypes; Type has few distinct values so it is parsed as a category
+CSV_DTYPES = {
+    'Equipment Name': 'string',
+    'Type': 'category',
+    'Flowrate': 'float64',
+    'Pressure': 'float64',
+    'Temperature': 'float64',
+}
+
+
+def _copy_equipment(dataset, frame):
+    """Load the rows of a cleaned CSV chunk with PostgreSQL COPY, bypassing the ORM"""
+    buffer = io.StringIO()
+    frame.assign(dataset_id=dataset.id).to_csv(
+        buffer, index=False, header=False, columns=['dataset_id', *REQUIRED_COLUMNS]
+    )
+    buffer.seek(0)
+    
+    sql = (
+        f'COPY {Equipment._meta.db_table} '
+        '(dataset_id, equipment_name, equipment_type, flowrate, pressure, temperature) '
+        'FROM STDIN WITH CSV'
+    )
+    with connection.cursor() as cursor:
+        if hasattr(cursor.cursor, 'copy_expert'):  # psycopg2
+            cursor.cursor.copy_expert(sql, buffer)
+        else:  # psycopg 3
+            with cursor.cursor.copy(sql) as copy:
+                copy.write(buffer.getvalue())
+
+
+def _bulk_create_equipment(dataset, frame):
+    """Insert the rows of a cleaned CSV chunk as Equipment records"""
+    if settings.USE_PG_COPY and connection.vendor == 'postgresql':
+        _copy_equipment(dataset, frame)
+        return
+    
+    equipment_records = (
+        Equipment(
+            dataset=dataset,
+            equipment_name=name,
+            equipment_type=equipment_type,
+            flowrate=flowrate,
+            pressure=pressure,
+            temperature=temperature
+        )
+        for name, equipment_type, flowrate, pressure, temperature
+        in frame[REQUIRED_COLUMNS].itertuples(index=False, name=None)
+    )
+    
+    # Insert in fixed-size batches so the full model list never materializes
+    while True:
+        batch = list(islice(equipment_records, BULK_CREATE_BATCH_SIZE))
+        if not batch:
+            break
+        Equipment.objects.bulk_create(batch, batch_size=BULK_CREATE_BATCH_SIZE)
+
+
+def _trim_datasets(keep):
+    """
+    Delete every dataset except the newest `keep`, ranking them with a
+    window function so concurrent uploads can't skew the count
+    """
+    dataset_table = Dataset._meta.db_table
+    equipment_table = Equipment._meta.db_table
+    stale_ids = (
+        f'SELECT id FROM ('
+        f'SELECT id, ROW_NUMBER() OVER (ORDER BY uploaded_at DESC, id DESC) AS rn '
+        f'FROM {dataset_table}'
+        f') ranked WHERE rn > %s'
+    )
+    
+    with transaction.atomic(), connection.cursor() as cursor:
+        # Equipment rows have no database-level cascade, so remove them first and
+        # skip any dataset that became stale in between and still owns records
+        cursor.execute(f'DELETE FROM {equipment_table} WHERE dataset_id IN ({stale_ids})', [keep])
+        cursor.execute(
+            f'DELETE FROM {dataset_table} WHERE id IN ({stale_ids}) '
+            f'AND NOT EXISTS (SELECT 1 FROM {equipment_table} WHERE dataset_id = {dataset_table}.id)',
+            [keep]
+        )
+
+
+def _query_int(request, name, default=None):
+    """Read a non-negative integer query parameter, raising ValueError if malformed"""
+    value = request.query_params.get(name)
+    if value is None:
+        return default
+    value = int(value)
+    if value < 0:
+        raise ValueError(f'{name} must not be negative')
+    return value
+
+
+def _stream_dataset_json(dataset, limit=None):
+    """
+    Yield the DatasetSerializer payload for a dataset piece by piece so the
+    equipment records are never held in memory all at once
+    When `limit` is given only the first `limit` records are included
+    """
+    header = json.dumps(DatasetListSerializer(dataset).data, separators=(',', ':'))
+    yield header[:-1] + ',"equipment_records":['
+    
+    records = dataset.equipment_records.order_by(*EQUIPMENT_ORDERING).values_list(*EQUIPMENT_FIELDS)
+    if limit is not None:
+        records = records[:limit]
+    records = records.iterator(chunk_size=BULK_CREATE_BATCH_SIZE)
+    first = True
+    while True:
+        batch = list(islice(records, BULK_CREATE_BATCH_SIZE))
+        if not batch:
+            break
+        payload = ','.join(
+            json.dumps(dict(zip(EQUIPMENT_FIELDS, record)), separators=(',', ':'))
+            for record in batch
+        )
+        yield payload if first else ',' + payload
+        first = False
+    
+    yield ']}'
 
 
 class DatasetViewSet(viewsets.ModelViewSet):
@@ -25,15 +174,69 @@ class DatasetViewSet(viewsets.ModelViewSet):
     
     def list(self, request):
         """Get last 5 datasets"""
-        datasets = Dataset.objects.all()[:5]
+        datasets = Dataset.objects.only(
+            'id', 'filename', 'uploaded_at', 'total_records', 'summary_data'
+        )[:5]
         serializer = self.get_serializer(datasets, many=True)
         return Response(serializer.data)
     
+    def retrieve(self, request, pk=None):
+        """
+        Get a dataset with its equipment records
+        Pass ?page_size=N to include only the first N records; the rest can
+        be paged in through the rows endpoint
+        """
+        dataset = self.get_object()
+        
+        try:
+            page_size = _query_int(request, 'page_size')
+        except ValueError:
+            return Response(
+                {'error': 'page_size must be a non-negative integer'},
+                status=status.HTTP_400_BAD_REQUEST
+            )
+        
+        if page_size is None:
+            return Response(DatasetSerializer(dataset).data)
+        
+        data = DatasetListSerializer(dataset).data
+        records = dataset.equipment_records.order_by(*EQUIPMENT_ORDERING)[:page_size]
+        data['equipment_records'] = EquipmentSerializer(records, many=True).data
+        return Response(data)
+    
+    @action(detail=True, methods=['get'])
+    def rows(self, request, pk=None):
+        """
+        Page through a dataset's equipment records
+        Query parameters: offset (default 0) and limit (default 500, max 5000)
+        Records are sent as value arrays in `fields` order rather than as
+        objects, so field names are not repeated on every row
+        """
+        dataset = self.get_object()
+        
+        try:
+            offset = _query_int(request, 'offset', 0)
+            limit = min(_query_int(request, 'limit', ROWS_PAGE_SIZE), ROWS_MAX_PAGE_SIZE)
+        except ValueError:
+            return Response(
+                {'error': 'offset and limit must be non-negative integers'},
+                status=status.HTTP_400_BAD_REQUEST
+            )
+        
+        records = dataset.equipment_records.order_by(*EQUIPMENT_ORDERING).values_list(*EQUIPMENT_FIELDS)
+        return Response({
+            'count': dataset.total_records,
+            'offset': offset,
+            'fields': EQUIPMENT_FIELDS,
+            'rows': list(records[offset:offset + limit]),
+        })
+    
     @action(detail=False, methods=['post'])
     def upload(self, request):
         """
         Upload and process CSV file
         Expected columns: Equipment Name, Type, Flowrate, Pressure, Temperature
+        Pass ?page_size=N to return only the first N equipment records
         """
         if 'file' not in request.FILES:
             return Response(
@@ -43,6 +246,14 @@ class DatasetViewSet(viewsets.ModelViewSet):
         
         csv_file = request.FILES['file']
         
+        try:
+            page_size = _query_int(request, 'page_size')
+        except ValueError:
+            return Response(
+                {'error': 'page_size must be a non-negative integer'},
+                status=status.HTTP_400_BAD_REQUEST
+            )
+        
         # Validate file extension
         if not csv_file.name.endswith('.csv'):
             return Response(
@@ -51,12 +262,11 @@ class DatasetViewSet(viewsets.ModelViewSet):
             )
         
         try:
-            # Read CSV using pandas
-            df = pd.read_csv(csv_file)
-            
-            # Validate required columns
-            required_columns = ['Equipment Name', 'Type', 'Flowrate', 'Pressure', 'Temperature']
-            missing_columns = [col for col in required_columns if col not in df.columns]
+            # Validate required columns from the header line before parsing anything
+            header_line = csv_file.readline().decode('utf-8-sig', errors='replace')
+            csv_file.seek(0)
+            header_columns = next(csv.reader([header_line]), [])
+            missing_columns = [col for col in REQUIRED_COLUMNS if col not in header_columns]
             
             if missing_columns:
                 return Response(
@@ -64,62 +274,97 @@ class DatasetViewSet(viewsets.ModelViewSet):
                     status=status.HTTP_400_BAD_REQUEST
                 )
             
-            # Clean data - remove rows with missing values
-            df_clean = df.dropna(subset=required_columns)
-            
-            if len(df_clean) == 0:
-                return Response(
-                    {'error': 'No valid data found in CSV'},
-                    status=status.HTTP_400_BAD_REQUEST
-                )
-            
-            # Create dataset
-            dataset = Dataset.objects.create(
-                user=request.user if request.user.is_authenticated else None,
-                filename=csv_file.name,
-                total_records=len(df_clean)
+            # Stream the CSV in chunks so memory stays bounded by the chunk size
+            reader = pd.read_csv(
+                csv_file,
+                usecols=REQUIRED_COLUMNS,
+                dtype=CSV_DTYPES,
+                engine='c',
+                chunksize=CSV_CHUNK_SIZE
             )
             
-            # Calculate summary statistics
-            summary = {
-                'total_count': len(df_clean),
-                'avg_flowrate': float(df_clean['Flowrate'].mean()),
-                'avg_pressure': float(df_clean['Pressure'].mean()),
-                'avg_temperature': float(df_clean['Temperature'].mean()),
-                'type_distribution': df_clean['Type'].value_counts().to_dict(),
-                'min_flowrate': float(df_clean['Flowrate'].min()),
-                'max_flowrate': float(df_clean['Flowrate'].max()),
-                'min_pressure': float(df_clean['Pressure'].min()),
-                'max_pressure': float(df_clean['Pressure'].max()),
-                'min_temperature': float(df_clean['Temperature'].min()),
-                'max_temperature': float(df_clean['Temperature'].max()),
-            }
-            
-            dataset.set_summary_data(summary)
-            dataset.save()
+            dataset = None
+            total_count = 0
+            column_stats = {}
+            type_counts = Counter()
             
-            # Create equipment records
-            equipment_list = []
-            for _, row in df_clean.iterrows():
-                equipment_list.append(Equipment(
-                    dataset=dataset,
-                    equipment_name=row['Equipment Name'],
-                    equipment_type=row['Type'],
-                    flowrate=float(row['Flowrate']),
-                    pressure=float(row['Pressure']),
-                    temperature=float(row['Temperature'])
-                ))
-            
-            Equipment.objects.bulk_create(equipment_list)
+            with transaction.atomic():
+                for chunk in reader:
+                    # Clean data - remove rows with missing values
+                    chunk.dropna(subset=REQUIRED_COLUMNS, inplace=True)
+                    if chunk.empty:
+                        continue
+                    
+                    if dataset is None:
+                        dataset = Dataset.objects.create(
+                            user=request.user if request.user.is_authenticated else None,
+                            filename=csv_file.name
+                        )
+                    
+                    # Accumulate summary statistics
+                    total_count += len(chunk)
+                    for column in NUMERIC_COLUMNS:
+                        # Reduce the raw float64 column buffer directly; DataFrame.agg
+                        # dispatch costs far more than the scans themselves
+                        values = chunk[column].to_numpy(dtype='float64')
+                        chunk_stats = {
+                            'min': float(values.min()),
+                            'sum': float(values.sum()),
+                            'max': float(values.max()),
+                        }
+                        running = column_stats.setdefault(column, chunk_stats)
+                        if running is not chunk_stats:
+                            running['min'] = min(running['min'], chunk_stats['min'])
+                            running['sum'] += chunk_stats['sum']
+                            running['max'] = max(running['max'], chunk_stats['max'])
+                    # Count types with a bincount over the category codes
+                    types = chunk['Type'].cat
+                    code_counts = np.bincount(types.codes.to_numpy(), minlength=len(types.categories))
+                    type_counts.update({
+                        equipment_type: count
+                        for equipment_type, count in zip(types.categories.tolist(), code_counts.tolist())
+                        if count
+                    })
+                    
+                    _bulk_create_equipment(dataset, chunk)
+                
+                if dataset is None:
+                    return Response(
+                        {'error': 'No valid data found in CSV'},
+                        status=status.HTTP_400_BAD_REQUEST
+                    )
+                
+                summary = {
+                    'total_count': total_count,
+                    **{
+                        f'avg_{column.lower()}': values['sum'] / total_count
+                        for column, values in column_stats.items()
+                    },
+                    'type_distribution': dict(type_counts.most_common()),
+                    **{
+                        f'{stat}_{column.lower()}': values[stat]
+                        for column, values in column_stats.items()
+                        for stat in ('min', 'max')
+                    },
+                }
+                
+                dataset.total_records = total_count
+                dataset.summary_data = summary
+                dataset.save()
+                
+                if settings.PRERENDER_PDF_REPORTS:
+                    dataset_id = dataset.id
+                    transaction.on_commit(lambda: schedule_pdf_report(dataset_id))
             
             # Maintain only last 5 datasets
-            old_datasets = Dataset.objects.all()[5:]
-            for old_dataset in old_datasets:
-                old_dataset.delete()
+            _trim_datasets(keep=5)
             
-            # Return created dataset with details
-            serializer = DatasetSerializer(dataset)
-            return Response(serializer.data, status=status.HTTP_201_CREATED)
+            # Return created dataset with details, streaming the equipment records
+            return StreamingHttpResponse(
+                _stream_dataset_json(dataset, page_size),
+                content_type='application/json',
+                status=status.HTTP_201_CREATED
+            )
             
         except Exception as e:
             return Response(
@@ -132,300 +377,13 @@ class DatasetViewSet(viewsets.ModelViewSet):
         """
         Generate enhanced PDF report with charts for a dataset
         """
-        import matplotlib
-        matplotlib.use('Agg')  # Use non-GUI backend
-        import matplotlib.pyplot as plt
-        from reportlab.lib.pagesizes import letter, A4
-        from reportlab.lib import colors
-        from reportlab.lib.styles import getSampleStyleSheet, ParagraphStyle
-        from reportlab.platypus import SimpleDocTemplate, Table, TableStyle, Paragraph, Spacer, PageBreak, Image
-        from reportlab.lib.units import inch
-        from reportlab.lib.enums import TA_CENTER, TA_LEFT
-        from reportlab.pdfgen import canvas
-        import tempfile
-        import os
-        
         dataset = self.get_object()
-        summary = dataset.get_summary_data()
-        
-        # Create PDF buffer
-        buffer = io.BytesIO()
-        doc = SimpleDocTemplate(
-            buffer, 
-            pagesize=letter,
-            rightMargin=0.75*inch,
-            leftMargin=0.75*inch,
-            topMargin=1*inch,
-            bottomMargin=0.75*inch,
-            title=f'ChemFlow Report - {dataset.filename}',
-            author='ChemFlow Analytics Platform',
-            subject='Chemical Equipment Analysis Report'
-            )
-        elements = []
-        styles = getSampleStyleSheet()
-        
-        # Custom styles
-        title_style = ParagraphStyle(
-            'CustomTitle',
-            parent=styles['Heading1'],
-            fontSize=24,
-            textColor=colors.HexColor('#10b981'),
-            spaceAfter=30,
-            alignment=TA_CENTER,
-            fontName='Helvetica-Bold'
-        )
-        
-        heading_style = ParagraphStyle(
-            'CustomHeading',
-            parent=styles['Heading2'],
-            fontSize=16,
-            textColor=colors.HexColor('#334155'),
-            spaceAfter=12,
-            spaceBefore=20,
-            fontName='Helvetica-Bold'
-        )
-        
-        # Header with colored background
-        header_data = [[Paragraph('<font size=24 color="#ffffff"><b>ChemFlow Analytics Report</b></font>', styles['Normal'])]]
-        header_table = Table(header_data, colWidths=[6.5*inch])
-        header_table.setStyle(TableStyle([
-            ('BACKGROUND', (0, 0), (-1, -1), colors.HexColor('#10b981')),
-            ('ALIGN', (0, 0), (-1, -1), 'CENTER'),
-            ('VALIGN', (0, 0), (-1, -1), 'MIDDLE'),
-            ('TOPPADDING', (0, 0), (-1, -1), 20),
-            ('BOTTOMPADDING', (0, 0), (-1, -1), 20),
-        ]))
-        elements.append(header_table)
-        elements.append(Spacer(1, 0.4*inch))
-        
-        # Dataset Information Card
-        info_data = [
-            ['Dataset Information', ''],
-            ['Filename:', dataset.filename],
-            ['Upload Date:', dataset.uploaded_at.strftime('%B %d, %Y at %H:%M:%S')],
-            ['Total Records:', str(dataset.total_records)],
-        ]
-        info_table = Table(info_data, colWidths=[2*inch, 4.5*inch])
-        info_table.setStyle(TableStyle([
-            ('BACKGROUND', (0, 0), (-1, 0), colors.HexColor('#334155')),
-            ('TEXTCOLOR', (0, 0), (-1, 0), colors.whitesmoke),
-            ('ALIGN', (0, 0), (-1, 0), 'CENTER'),
-            ('FONTNAME', (0, 0), (-1, 0), 'Helvetica-Bold'),
-            ('FONTSIZE', (0, 0), (-1, 0), 14),
-            ('BACKGROUND', (0, 1), (0, -1), colors.HexColor('#f1f5f9')),
-            ('FONTNAME', (0, 1), (0, -1), 'Helvetica-Bold'),
-            ('TEXTCOLOR', (0, 1), (0, -1), colors.HexColor('#475569')),
-            ('BACKGROUND', (1, 1), (1, -1), colors.white),
-            ('GRID', (0, 0), (-1, -1), 1, colors.HexColor('#e2e8f0')),
-            ('VALIGN', (0, 0), (-1, -1), 'MIDDLE'),
-            ('TOPPADDING', (0, 0), (-1, -1), 10),
-            ('BOTTOMPADDING', (0, 0), (-1, -1), 10),
-            ('LEFTPADDING', (0, 0), (-1, -1), 15),
-        ]))
-        elements.append(info_table)
-        elements.append(Spacer(1, 0.3*inch))
-        
-        # Summary Statistics Cards
-        elements.append(Paragraph('Summary Statistics', heading_style))
-        
-        stats_data = [
-            ['Parameter', 'Minimum', 'Average', 'Maximum'],
-            [
-                'Flowrate',
-                f"{summary.get('min_flowrate', 0):.2f}",
-                f"{summary.get('avg_flowrate', 0):.2f}",
-                f"{summary.get('max_flowrate', 0):.2f}"
-            ],
-            [
-                'Pressure',
-                f"{summary.get('min_pressure', 0):.2f}",
-                f"{summary.get('avg_pressure', 0):.2f}",
-                f"{summary.get('max_pressure', 0):.2f}"
-            ],
-            [
-                'Temperature',
-                f"{summary.get('min_temperature', 0):.2f}",
-                f"{summary.get('avg_temperature', 0):.2f}",
-                f"{summary.get('max_temperature', 0):.2f}"
-            ],
-        ]
-        
-        stats_table = Table(stats_data, colWidths=[2*inch, 1.5*inch, 1.5*inch, 1.5*inch])
-        stats_table.setStyle(TableStyle([
-            ('BACKGROUND', (0, 0), (-1, 0), colors.HexColor('#10b981')),
-            ('TEXTCOLOR', (0, 0), (-1, 0), colors.whitesmoke),
-            ('ALIGN', (0, 0), (-1, -1), 'CENTER'),
-            ('FONTNAME', (0, 0), (-1, 0), 'Helvetica-Bold'),
-            ('FONTSIZE', (0, 0), (-1, 0), 11),
-            ('FONTNAME', (0, 1), (0, -1), 'Helvetica-Bold'),
-            ('BACKGROUND', (0, 1), (-1, -1), colors.white),
-            ('ROWBACKGROUNDS', (0, 1), (-1, -1), [colors.white, colors.HexColor('#f8fafc')]),
-            ('GRID', (0, 0), (-1, -1), 1, colors.HexColor('#e2e8f0')),
-            ('VALIGN', (0, 0), (-1, -1), 'MIDDLE'),
-            ('TOPPADDING', (0, 0), (-1, -1), 10),
-            ('BOTTOMPADDING', (0, 0), (-1, -1), 10),
-        ]))
-        elements.append(stats_table)
-        elements.append(Spacer(1, 0.4*inch))
-        
-        # Generate Charts
-        type_dist = summary.get('type_distribution', {})
-        
-        if type_dist:
-            # Create temporary directory for charts
-            temp_dir = tempfile.mkdtemp()
-            
-            # 1. Bar Chart for Type Distribution
-            fig, ax = plt.subplots(figsize=(8, 4))
-            types = list(type_dist.keys())
-            counts = list(type_dist.values())
-            colors_list = ['#818cf8', '#34d399', '#a78bfa', '#fb923c', '#fbbf24', '#38bdf8']
-            
-            bars = ax.bar(types, counts, color=colors_list[:len(types)], edgecolor='white', linewidth=2)
-            ax.set_xlabel('Equipment Type', fontsize=12, fontweight='bold')
-            ax.set_ylabel('Count', fontsize=12, fontweight='bold')
-            ax.set_title('Equipment Type Distribution', fontsize=14, fontweight='bold', pad=20)
-            ax.spines['top'].set_visible(False)
-            ax.spines['right'].set_visible(False)
-            ax.grid(axis='y', alpha=0.3, linestyle='--')
-            
-            # Add value labels on bars
-            for bar in bars:
-                height = bar.get_height()
-                ax.text(bar.get_x() + bar.get_width()/2., height,
-                       f'{int(height)}',
-                       ha='center', va='bottom', fontweight='bold')
-            
-            plt.tight_layout()
-            bar_chart_path = os.path.join(temp_dir, 'bar_chart.png')
-            plt.savefig(bar_chart_path, dpi=150, bbox_inches='tight', facecolor='white')
-            plt.close()
-            
-            elements.append(Paragraph('Equipment Type Distribution', heading_style))
-            elements.append(Spacer(1, 0.1*inch))
-            elements.append(Image(bar_chart_path, width=6*inch, height=3*inch))
-            elements.append(Spacer(1, 0.3*inch))
-            
-            # 2. Pie Chart
-            fig, ax = plt.subplots(figsize=(7, 5))
-            pie_result = ax.pie(
-                counts, 
-                labels=types, 
-                autopct='%1.1f%%',
-                colors=colors_list[:len(types)],
-                startangle=90,
-                explode=[0.05] * len(types),
-                shadow=True
-            )
-            wedges, texts, autotexts = pie_result if len(pie_result) == 3 else (pie_result[0], pie_result[1], [])
-            
-            for text in texts:
-                text.set_fontsize(11)
-                text.set_fontweight('bold')
-            for autotext in autotexts:
-                autotext.set_color('white')
-                autotext.set_fontsize(10)
-                autotext.set_fontweight('bold')
-                
-            ax.set_title('Type Distribution Breakdown', fontsize=14, fontweight='bold', pad=20)
-            plt.tight_layout()
-            pie_chart_path = os.path.join(temp_dir, 'pie_chart.png')
-            plt.savefig(pie_chart_path, dpi=150, bbox_inches='tight', facecolor='white')
-            plt.close()
-            
-            elements.append(PageBreak())
-            elements.append(Paragraph('Type Distribution Breakdown', heading_style))
-            elements.append(Spacer(1, 0.1*inch))
-            elements.append(Image(pie_chart_path, width=5*inch, height=3.5*inch))
-            elements.append(Spacer(1, 0.3*inch))
-            
-            # 3. Parameter Comparison Chart
-            fig, ax = plt.subplots(figsize=(8, 4))
-            parameters = ['Flowrate', 'Pressure', 'Temperature']
-            min_vals = [summary.get('min_flowrate', 0), summary.get('min_pressure', 0), summary.get('min_temperature', 0)]
-            avg_vals = [summary.get('avg_flowrate', 0), summary.get('avg_pressure', 0), summary.get('avg_temperature', 0)]
-            max_vals = [summary.get('max_flowrate', 0), summary.get('max_pressure', 0), summary.get('max_temperature', 0)]
-            
-            x = range(len(parameters))
-            width = 0.25
-            
-            ax.bar([i - width for i in x], min_vals, width, label='Minimum', color='#ef4444')
-            ax.bar(x, avg_vals, width, label='Average', color='#10b981')
-            ax.bar([i + width for i in x], max_vals, width, label='Maximum', color='#3b82f6')
-            
-            ax.set_xlabel('Parameters', fontsize=12, fontweight='bold')
-            ax.set_ylabel('Values', fontsize=12, fontweight='bold')
-            ax.set_title('Parameter Comparison (Min/Avg/Max)', fontsize=14, fontweight='bold', pad=20)
-            ax.set_xticks(x)
-            ax.set_xticklabels(parameters)
-            ax.legend(loc='upper left', framealpha=0.9)
-            ax.spines['top'].set_visible(False)
-            ax.spines['right'].set_visible(False)
-            ax.grid(axis='y', alpha=0.3, linestyle='--')
-            
-            plt.tight_layout()
-            comparison_chart_path = os.path.join(temp_dir, 'comparison_chart.png')
-            plt.savefig(comparison_chart_path, dpi=150, bbox_inches='tight', facecolor='white')
-            plt.close()
-            
-            elements.append(Paragraph('Parameter Comparison Analysis', heading_style))
-            elements.append(Spacer(1, 0.1*inch))
-            elements.append(Image(comparison_chart_path, width=6*inch, height=3*inch))
-            elements.append(Spacer(1, 0.3*inch))
-        
-        # Equipment Records Table
-        elements.append(PageBreak())
-        elements.append(Paragraph('Equipment Records Details', heading_style))
-        elements.append(Spacer(1, 0.2*inch))
-        
-        equipment = dataset.equipment_records.all()[:20]
-        
-        eq_data = [['Name', 'Type', 'Flowrate', 'Pressure', 'Temperature']]
-        for eq in equipment:
-            eq_data.append([
-                eq.equipment_name[:25],
-                eq.equipment_type,
-                f"{eq.flowrate:.2f}",
-                f"{eq.pressure:.2f}",
-                f"{eq.temperature:.2f}"
-            ])
-        
-        eq_table = Table(eq_data, colWidths=[2*inch, 1.3*inch, 1.1*inch, 1.1*inch, 1*inch])
-        eq_table.setStyle(TableStyle([
-            ('BACKGROUND', (0, 0), (-1, 0), colors.HexColor('#334155')),
-            ('TEXTCOLOR', (0, 0), (-1, 0), colors.whitesmoke),
-            ('ALIGN', (0, 0), (-1, -1), 'CENTER'),
-            ('FONTNAME', (0, 0), (-1, 0), 'Helvetica-Bold'),
-            ('FONTSIZE', (0, 0), (-1, 0), 10),
-            ('FONTSIZE', (0, 1), (-1, -1), 9),
-            ('ROWBACKGROUNDS', (0, 1), (-1, -1), [colors.white, colors.HexColor('#f8fafc')]),
-            ('GRID', (0, 0), (-1, -1), 1, colors.HexColor('#e2e8f0')),
-            ('VALIGN', (0, 0), (-1, -1), 'MIDDLE'),
-            ('TOPPADDING', (0, 0), (-1, -1), 8),
-            ('BOTTOMPADDING', (0, 0), (-1, -1), 8),
-        ]))
-        elements.append(eq_table)
-        
-        # Footer
-        elements.append(Spacer(1, 0.5*inch))
-        footer_text = f'<para align=center><font size=8 color="#64748b">Generated by ChemFlow Analytics Platform | {dataset.uploaded_at.strftime("%B %d, %Y")}</font></para>'
-        elements.append(Paragraph(footer_text, styles['Normal']))
-        
-        # Build PDF
-        doc.build(elements)
-        buffer.seek(0)
         
-        # Clean up temporary files
-        if type_dist:
-            try:
-                os.remove(bar_chart_path)
-                os.remove(pie_chart_path)
-                os.remove(comparison_chart_path)
-                os.rmdir(temp_dir)
-            except:
-                pass
+        # Served from the cache when already rendered, either by an earlier
+        # download or in the background after upload (PRERENDER_PDF_REPORTS)
+        pdf_bytes = get_pdf_report(dataset)
         
         # Return PDF response
-        response = HttpResponse(buffer.getvalue(), content_type='application/pdf')
+        response = HttpResponse(pdf_bytes, content_type='application/pdf')
         response['Content-Disposition'] = f'attachment; filename="chemflow_report_{dataset.id}.pdf"'
-        return response
\ No newline at end of file
+        return response